@@ -16,25 +16,213 @@ Requirements:
 - Install with: pip install -r requirements.txt
 """
 
+import argparse
+import asyncio
+import json
 import paramiko
 import getpass
+import select
+import socket
+import sys
+import threading
 import time
 import re
 import os
+
+# asyncssh multiplexes many SSH sessions on one event loop and scales to
+# far larger fleets than one paramiko transport thread per host; fall
+# back to paramiko when it isn't installed
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
+# xlsxwriter's constant_memory mode flushes rows to disk as they are
+# written and handles our repetitive hostname/home columns faster than
+# openpyxl; fall back to openpyxl's write-only mode when it isn't installed
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from openpyxl import Workbook
 from datetime import datetime
 
+# Precompiled patterns, hoisted to module level so the hot parsing loops
+# skip the per-call regex-cache lookup
+_RE_RELEASE = re.compile(r'[Rr]elease\s+([\d\.]+)')
+_RE_VERSION = re.compile(r'[Vv]ersion\s+([\d\.]+)')
+_RE_GENERIC_VER = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+_RE_LSPATCHES = re.compile(r'^(\d+);(.*)$', re.M)
+_RE_ORA_VERSION = re.compile(r'Version (\d+\.\d+\.\d+\.\d+)')
+_RE_OPATCH_VERSION = re.compile(r'Version: ([\d\.]+)')
+_RE_SECTION = re.compile(r'^---(\w+)---$')
+# oratab entries: SID:ORACLE_HOME:START, skipping comment lines
+_RE_ORATAB = re.compile(r'^(?!\s*#)(?P<sid>[^:\n]+):(?P<home>[^:\n]*):', re.M)
+# Per-patch inventory.xml fragments (one <oneoff_inventory> root per file)
+_RE_INV_ONEOFF = re.compile(r'<oneoff_inventory[^>]*>(.*?)</oneoff_inventory>', re.S)
+_RE_INV_ID = re.compile(r'<patch_id\s+number="(\d+)"')
+_RE_INV_DESC = re.compile(r'<patch_description>(.*?)</patch_description>', re.S)
+_RE_KIND = re.compile(r'(database|db|ojvm|java|ocw|client)', re.I)
+
+# Maps patch-type keywords matched by _RE_KIND to result keys
+_KIND_KEYS = {
+    'database': 'database_release',
+    'db': 'database_release',
+    'ojvm': 'ojvm_release',
+    'java': 'ojvm_release',
+    'ocw': 'ocw_release',
+    'client': 'ocw_release',
+}
+
+# On-disk cache of raw per-home OPatch output, keyed by
+# hostname:oracle_home:inventory_mtime so unchanged homes skip the
+# expensive opatch invocations on repeat runs
+_CACHE_PATH = os.path.expanduser("~/.oracle_patch_collector_cache.json")
+_cache_lock = threading.Lock()
+_patch_cache = None
+
+def _load_patch_cache():
+    """
+    Loads the patch cache from disk on first use (thread-safe)
+    """
+    global _patch_cache
+    with _cache_lock:
+        if _patch_cache is None:
+            try:
+                with open(_CACHE_PATH, 'r') as f:
+                    _patch_cache = json.load(f)
+            except (OSError, ValueError):
+                _patch_cache = {}
+    return _patch_cache
+
+def _save_patch_cache():
+    """
+    Persists the patch cache back to disk
+    """
+    with _cache_lock:
+        if _patch_cache is None:
+            return
+        try:
+            with open(_CACHE_PATH, 'w') as f:
+                json.dump(_patch_cache, f)
+        except OSError as e:
+            print(f"Warning: could not save patch cache: {str(e)}")
+
+# Constrain negotiation to AES-NI-accelerated ciphers and modern key
+# exchange; the older CBC/CTR fallbacks paramiko may otherwise agree on
+# cost noticeably more CPU when reading large lspatches outputs
+_PREFERRED_CIPHERS = ('aes128-gcm@openssh.com', 'aes256-gcm@openssh.com',
+                      'aes128-ctr', 'aes256-ctr')
+_PREFERRED_KEX = ('curve25519-sha256', 'curve25519-sha256@libssh.org',
+                  'ecdh-sha2-nistp256')
+
+# Shared event loop for all asyncssh connections, started lazily on a
+# daemon thread so the synchronous pipeline can drive it from workers
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+def _get_async_loop():
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            _async_loop = loop
+    return _async_loop
+
+class AsyncSSHClient:
+    """
+    Synchronous facade over an asyncssh connection, exposing just enough
+    surface for run_command/run_many so the collection pipeline works
+    unchanged over either backend. All connections share one event loop,
+    so sessions multiplex cooperatively instead of each holding a
+    paramiko transport thread.
+    """
+    def __init__(self, conn):
+        self._conn = conn
+
+    def _wait(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result()
+
+    def run(self, command):
+        result = self._wait(self._conn.run(command, check=False))
+        stderr = result.stderr or ""
+        if stderr and not "ORA-" in stderr:  # Ignore common Oracle errors
+            print(f"Error executing command: {stderr}")
+        return result.stdout or ""
+
+    def run_many(self, commands):
+        async def _gather():
+            results = await asyncio.gather(
+                *[self._conn.run(command, check=False) for command in commands])
+            return [result.stdout or "" for result in results]
+        return self._wait(_gather())
+
+    def close(self):
+        # asyncssh objects are not thread-safe: schedule the close on the
+        # loop thread rather than mutating loop state from a worker
+        _get_async_loop().call_soon_threadsafe(self._conn.close)
+        self._wait(self._conn.wait_closed())
+
+def _connect_asyncssh(hostname, username, password, max_retries):
+    """
+    Establishes an asyncssh connection with the same retry behavior as
+    the paramiko path. Returns an AsyncSSHClient or None
+    """
+    loop = _get_async_loop()
+
+    retry_count = 0
+    while retry_count <= max_retries:
+        try:
+            conn = asyncio.run_coroutine_threadsafe(
+                asyncssh.connect(hostname, username=username, password=password,
+                                 known_hosts=None, login_timeout=10), loop).result()
+            return AsyncSSHClient(conn)
+        except asyncssh.PermissionDenied:
+            print(f"Authentication failed for {hostname} with username {username}")
+            return None
+        except (asyncssh.Error, OSError) as e:
+            print(f"SSH error: {str(e)}")
+            retry_count += 1
+            if retry_count <= max_retries:
+                print(f"Retrying connection ({retry_count}/{max_retries})...")
+                time.sleep(2)
+            else:
+                print(f"Max retries reached for {hostname}")
+                return None
+        except Exception as e:
+            print(f"Connection error to {hostname}: {str(e)}")
+            return None
+
 def connect_to_server(hostname, username, password, max_retries=1):
     """
     Establishes SSH connection to a server with retry capability
     """
+    if asyncssh is not None:
+        return _connect_asyncssh(hostname, username, password, max_retries)
+
+    paramiko.Transport._preferred_ciphers = _PREFERRED_CIPHERS
+    paramiko.Transport._preferred_kex = _PREFERRED_KEX
+
     ssh = paramiko.SSHClient()
     ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    
+
     retry_count = 0
     while retry_count <= max_retries:
         try:
             ssh.connect(hostname, username=username, password=password, timeout=10)
+
+            # Keep the session alive and disable Nagle so small command
+            # packets aren't delayed behind unacked data
+            transport = ssh.get_transport()
+            transport.set_keepalive(30)
+            try:
+                transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (AttributeError, OSError):
+                pass
+
             return ssh
         except paramiko.AuthenticationException:
             print(f"Authentication failed for {hostname} with username {username}")
@@ -58,52 +246,145 @@ def run_command(ssh, command):
     """
     if ssh is None:
         return ""
-    
+
+    if isinstance(ssh, AsyncSSHClient):
+        return ssh.run(command)
+
     try:
         stdin, stdout, stderr = ssh.exec_command(command)
-        output = stdout.read().decode('utf-8')
-        error = stderr.read().decode('utf-8')
-        
-        if error and not "ORA-" in error:  # Ignore common Oracle errors
+        channel = stdout.channel
+
+        # Drain stdout and stderr as data arrives so a full stderr buffer
+        # can't stall stdout (and vice versa) while waiting for EOF
+        out_buf = bytearray()
+        err_buf = bytearray()
+        while True:
+            if channel.recv_ready():
+                out_buf += channel.recv(65536)
+            elif channel.recv_stderr_ready():
+                err_buf += channel.recv_stderr(65536)
+            elif channel.exit_status_ready():
+                break
+            else:
+                select.select([channel], [], [], 0.1)
+
+        # Flush anything still buffered after the exit status arrived
+        while channel.recv_ready():
+            out_buf += channel.recv(65536)
+        while channel.recv_stderr_ready():
+            err_buf += channel.recv_stderr(65536)
+
+        output = bytes(out_buf).decode('utf-8', errors='replace')
+
+        # Test stderr on the raw bytes; decoding is only worth doing for
+        # the short preview we actually print
+        if err_buf and b"ORA-" not in err_buf:  # Ignore common Oracle errors
+            error = bytes(err_buf[:512]).decode('utf-8', errors='replace')
             print(f"Error executing command: {error}")
-        
+
         return output
     except Exception as e:
         print(f"Error running command: {str(e)}")
         return ""
 
+def run_many(ssh, commands):
+    """
+    Executes several commands concurrently over separate channels on the
+    existing SSH transport and returns their outputs in command order.
+    Channels are opened up front so the per-command open round-trips overlap
+    instead of being paid sequentially.
+    """
+    if ssh is None or not commands:
+        return ["" for _ in commands]
+
+    if isinstance(ssh, AsyncSSHClient):
+        return ssh.run_many(commands)
+
+    try:
+        transport = ssh.get_transport()
+        channels = []
+        for command in commands:
+            channel = transport.open_session()
+            channel.exec_command(command)
+            channels.append(channel)
+    except Exception as e:
+        print(f"Error opening channels: {str(e)}")
+        # Fall back to sequential execution on the shared client
+        return [run_command(ssh, command) for command in commands]
+
+    outputs = [bytearray() for _ in channels]
+    pending = dict(enumerate(channels))
+
+    while pending:
+        readable, _, _ = select.select(list(pending.values()), [], [], 1.0)
+        for index in list(pending):
+            channel = pending[index]
+            if channel not in readable:
+                continue
+            # Drain stderr so a chatty command can't stall the channel
+            while channel.recv_stderr_ready():
+                channel.recv_stderr(65536)
+            data = channel.recv(65536)
+            if data:
+                outputs[index] += data
+            else:
+                channel.close()
+                del pending[index]
+
+    return [bytes(output).decode('utf-8', errors='replace') for output in outputs]
+
+def split_sections(output, marker_re):
+    """
+    Splits batched command output into {section_name: text} using the
+    given marker regex (e.g. lines like ---ORATAB---)
+    """
+    sections = {}
+    current = None
+    for line in output.splitlines():
+        marker = marker_re.match(line.strip())
+        if marker:
+            current = marker.group(1)
+            sections[current] = []
+        elif current is not None:
+            sections[current].append(line)
+    return {name: '\n'.join(lines) for name, lines in sections.items()}
+
 def find_oracle_homes(ssh):
     """
     Finds all Oracle home directories on the server
     """
     if ssh is None:
         return []
-    
-    # Various commands to detect Oracle homes
-    # First try the oratab file which is the most reliable source
-    oratab_cmd = "cat /etc/oratab 2>/dev/null || cat /var/opt/oracle/oratab 2>/dev/null"
-    oratab_output = run_command(ssh, oratab_cmd)
-    
-    oracle_homes = []
-    
-    # Parse oratab output to extract Oracle homes
-    if oratab_output:
-        for line in oratab_output.splitlines():
-            # Skip comments and empty lines
-            if line.startswith('#') or not line.strip():
-                continue
-            
-            # Format is usually: SID:ORACLE_HOME:START
-            parts = line.split(':')
-            if len(parts) >= 2 and parts[1] and parts[1] != '/':
-                oracle_homes.append(parts[1].strip())
+
+    # Run all detection commands in one batched script so the host pays a
+    # single SSH channel round-trip instead of one per probe. The find walk
+    # can take minutes on large hosts, so it stays guarded shell-side and
+    # only runs when oratab has no usable entries
+    discovery_script = (
+        "OT=$(cat /etc/oratab 2>/dev/null || cat /var/opt/oracle/oratab 2>/dev/null); "
+        "echo '---ORATAB---'; "
+        "printf '%s\\n' \"$OT\"; "
+        "echo '---FIND---'; "
+        "if [ -z \"$(printf '%s\\n' \"$OT\" | grep -v '^[[:space:]]*#' | grep :)\" ]; then "
+        "find /u01 /opt /oracle -name dbhome_1 -o -name dbhome_2 -o -name dbhome_3 2>/dev/null; "
+        "fi; "
+        "echo '---ENV---'; "
+        "env | grep ORACLE_HOME"
+    )
+    sections = split_sections(run_command(ssh, discovery_script), _RE_SECTION)
+
+    # Parse oratab output (the most reliable source) in a single regex
+    # pass instead of iterating lines in Python
+    oratab_output = sections.get("ORATAB", "")
+    oracle_homes = [match.group('home').strip()
+                    for match in _RE_ORATAB.finditer(oratab_output)
+                    if match.group('home').strip() not in ('', '/')]
     
     # If we didn't find any homes in oratab, try other methods
     if not oracle_homes:
-        # Try to find Oracle homes by searching for common Oracle directories
-        find_cmd = "find /u01 /opt /oracle -name dbhome_1 -o -name dbhome_2 -o -name dbhome_3 2>/dev/null"
-        find_output = run_command(ssh, find_cmd)
-        
+        # Oracle homes found by searching for common Oracle directories
+        find_output = sections.get("FIND", "")
+
         if find_output:
             for line in find_output.splitlines():
                 if line.strip():
@@ -113,20 +394,16 @@ def find_oracle_homes(ssh):
     
     # If we still didn't find any homes, try checking environment variables
     if not oracle_homes:
-        env_cmd = "env | grep ORACLE_HOME"
-        env_output = run_command(ssh, env_cmd)
-        
+        env_output = sections.get("ENV", "")
+
         if env_output:
             for line in env_output.splitlines():
                 if "ORACLE_HOME=" in line:
                     oracle_home = line.split("=")[1].strip()
                     oracle_homes.append(oracle_home)
     
-    # Remove duplicates while preserving order
-    unique_homes = []
-    for home in oracle_homes:
-        if home not in unique_homes:
-            unique_homes.append(home)
+    # Remove duplicates while preserving insertion order
+    unique_homes = list(dict.fromkeys(oracle_homes))
     
     # Add a default location as fallback if nothing was found
     if not unique_homes:
@@ -140,105 +417,245 @@ def extract_release_info(description):
     Attempts to extract release information from patch description
     """
     # Look for patterns like "Release x.x.x.x" or "version x.x.x.x"
-    release_match = re.search(r'[Rr]elease\s+([\d\.]+)', description)
+    release_match = _RE_RELEASE.search(description)
     if release_match:
         return release_match.group(1)
-    
-    version_match = re.search(r'[Vv]ersion\s+([\d\.]+)', description)
+
+    version_match = _RE_VERSION.search(description)
     if version_match:
         return version_match.group(1)
-    
+
     # Look for any version-like pattern in the description
-    generic_version = re.search(r'(\d+\.\d+\.\d+\.\d+)', description)
+    generic_version = _RE_GENERIC_VER.search(description)
     if generic_version:
         return generic_version.group(1)
-    
+
     return ""
 
+@lru_cache(maxsize=1024)
+def _parse_version(version):
+    """
+    Parses a dotted version string into a tuple of ints. Cached because
+    bundle patches repeat the same release string across many lspatches lines
+    """
+    return tuple(int(x) for x in version.split('.') if x.isdigit())
+
 def version_is_newer(ver1, ver2):
     """
     Compares two version strings and returns True if ver1 is newer than ver2
     """
-    # Split version strings into components
-    ver1_parts = [int(x) for x in ver1.split('.') if x.isdigit()]
-    ver2_parts = [int(x) for x in ver2.split('.') if x.isdigit()]
-    
-    # Make sure both lists have the same length
-    while len(ver1_parts) < len(ver2_parts):
-        ver1_parts.append(0)
-    while len(ver2_parts) < len(ver1_parts):
-        ver2_parts.append(0)
-    
-    # Compare part by part
-    for i in range(len(ver1_parts)):
-        if ver1_parts[i] > ver2_parts[i]:
-            return True
-        elif ver1_parts[i] < ver2_parts[i]:
-            return False
-    
-    # If we get here, versions are equal
-    return False
+    ver1_parts = _parse_version(ver1)
+    ver2_parts = _parse_version(ver2)
+
+    # Pad to the same length and let tuple comparison do the
+    # lexicographic compare in C
+    length = max(len(ver1_parts), len(ver2_parts))
+    ver1_parts += (0,) * (length - len(ver1_parts))
+    ver2_parts += (0,) * (length - len(ver2_parts))
 
-def get_oracle_patches(ssh):
+    return ver1_parts > ver2_parts
+
+def parse_inventory_xml(inventory_output):
+    """
+    Converts concatenated per-patch inventory.xml content into the
+    'id;description' line format produced by opatch lspatches, so the
+    rest of the parsing pipeline works unchanged
+    """
+    lines = []
+    for block in _RE_INV_ONEOFF.finditer(inventory_output):
+        text = block.group(1)
+        id_match = _RE_INV_ID.search(text)
+        desc_match = _RE_INV_DESC.search(text)
+        if id_match and desc_match:
+            lines.append(f"{id_match.group(1)};{desc_match.group(1).strip()}")
+    return '\n'.join(lines)
+
+def sid_probe_cmd(oracle_home):
+    """
+    Builds the awk one-liner that extracts the SID of the pmon process
+    running out of the given Oracle home
+    """
+    return (f"ps -eo args | awk -v h='{oracle_home}' "
+            f"'$0 ~ h && /ora_pmon_/ {{for (i=1;i<=NF;i++) "
+            f"if ($i ~ /^ora_pmon_/) {{sub(\"ora_pmon_\",\"\",$i); print $i}}}}'")
+
+def sid_from_path(oracle_home):
+    """
+    Derives a SID from the Oracle home path (common naming convention),
+    used when no matching pmon process is running
+    """
+    for part in oracle_home.split('/'):
+        if part.startswith('db_') or part.startswith('ora'):
+            return part
+    return ""
+
+def get_home_mtimes(ssh, oracle_homes):
+    """
+    Fetches the inventory modification time for each Oracle home in one
+    batched command. Returns {oracle_home: mtime_string}; homes whose
+    inventory could not be stat'ed are omitted
+    """
+    script_parts = []
+    for oracle_home in oracle_homes:
+        script_parts.append(
+            f"echo '===HOME:{oracle_home}==='; "
+            f"stat -c %Y {oracle_home}/inventory/oneoffs 2>/dev/null || "
+            f"stat -c %Y {oracle_home}/OPatch 2>/dev/null"
+        )
+    output = run_command(ssh, "; ".join(script_parts))
+
+    mtimes = {}
+    chunks = re.split(r'^===HOME:(.+)===$', output, flags=re.M)
+    for oracle_home, block in zip(chunks[1::2], chunks[2::2]):
+        mtime = block.strip()
+        if mtime:
+            mtimes[oracle_home.strip()] = mtime
+    return mtimes
+
+def get_oracle_patches(ssh, hostname=""):
     """
     Retrieves Oracle patch information from all Oracle homes
     """
     if ssh is None:
         return []
-    
+
     # Find all Oracle homes
     oracle_homes = find_oracle_homes(ssh)
-    patch_results = []
-    
+    if not oracle_homes:
+        return []
+
+    # Check the on-disk cache first: homes whose inventory mtime is
+    # unchanged since the last run skip the opatch round-trip entirely
+    cache = _load_patch_cache()
+    mtimes = get_home_mtimes(ssh, oracle_homes)
+
+    cached_results = {}
+    hit_homes = []
+    missed_homes = []
     for oracle_home in oracle_homes:
+        mtime = mtimes.get(oracle_home)
+        cache_key = f"{hostname}:{oracle_home}:{mtime}" if mtime else None
+        if cache_key and cache_key in cache:
+            print(f"Checking Oracle home: {oracle_home} (cached)")
+            hit_homes.append(oracle_home)
+        else:
+            missed_homes.append(oracle_home)
+
+    # Cache entries hold only the inventory-derived fields; the SID comes
+    # from a live ps probe and must be re-fetched even for cached homes,
+    # since instances start, stop and get renamed independently of patching
+    if hit_homes:
+        sid_outputs = run_many(ssh, [sid_probe_cmd(home) for home in hit_homes])
+        for oracle_home, sid_output in zip(hit_homes, sid_outputs):
+            sid_output = sid_output.strip() or sid_from_path(oracle_home)
+            entry = cache[f"{hostname}:{oracle_home}:{mtimes[oracle_home]}"]
+            cached_results[oracle_home] = {
+                "oracle_home": sys.intern(oracle_home),
+                "sid": sys.intern(sid_output),
+                "oracle_version": entry.get("oracle_version", ""),
+                "lspatches": entry.get("lspatches", ""),
+                "version": entry.get("version", "")
+            }
+
+    # Batch every per-home command into one script per home, sent over
+    # concurrently open channels so homes are collected in parallel
+    script_parts = []
+    for oracle_home in missed_homes:
+        script_parts.append(
+            f"echo '---OPATCH_CHECK---'; "
+            f"ls -l {oracle_home}/OPatch/opatch 2>/dev/null; "
+            # Read the inventory XML directly; each opatch call starts a
+            # JVM, which dominates per-home runtime
+            f"echo '---INVENTORY---'; "
+            f"cat {oracle_home}/inventory/oneoffs/*/etc/config/inventory.xml 2>/dev/null; "
+            f"echo '---LSPATCHES---'; "
+            f"ls {oracle_home}/inventory/oneoffs/*/etc/config/inventory.xml >/dev/null 2>&1 || "
+            f"{oracle_home}/OPatch/opatch lspatches 2>/dev/null; "
+            f"echo '---VERSION---'; "
+            f"{oracle_home}/OPatch/opatch version 2>/dev/null; "
+            f"echo '---SQLPLUS---'; "
+            f"{oracle_home}/bin/sqlplus -V 2>/dev/null; "
+            f"echo '---SID---'; "
+            + sid_probe_cmd(oracle_home)
+        )
+    home_outputs = run_many(ssh, script_parts)
+
+    fallback_homes = []
+    for oracle_home, block in zip(missed_homes, home_outputs):
         print(f"Checking Oracle home: {oracle_home}")
-        
-        # Check if OPatch exists in this home
-        opatch_check_cmd = f"ls -l {oracle_home}/OPatch/opatch 2>/dev/null"
-        opatch_check_result = run_command(ssh, opatch_check_cmd)
-        
-        if not opatch_check_result or "No such file" in opatch_check_result:
+
+        sections = split_sections(block, _RE_SECTION)
+
+        opatch_check_result = sections.get("OPATCH_CHECK", "")
+        if not opatch_check_result.strip() or "No such file" in opatch_check_result:
             print(f"  OPatch not found in {oracle_home}, skipping...")
             continue
-        
-        # Run OPatch commands
-        lspatches_cmd = f"{oracle_home}/OPatch/opatch lspatches"
-        version_cmd = f"{oracle_home}/OPatch/opatch version"
-        
-        lspatches_output = run_command(ssh, lspatches_cmd)
-        version_output = run_command(ssh, version_cmd)
-        
-        # Also get Oracle database version for this home
-        oracle_version_cmd = f"{oracle_home}/bin/sqlplus -V 2>/dev/null"
-        oracle_version_output = run_command(ssh, oracle_version_cmd)
-        
-        # Get SID/database name associated with this ORACLE_HOME if possible
-        sid_cmd = f"ps -ef | grep pmon | grep {oracle_home} | awk '{{print $NF}}' | sed 's/ora_pmon_//g'"
-        sid_output = run_command(ssh, sid_cmd).strip()
-        
-        # If we couldn't get SID from processes, try to derive it from the path
-        if not sid_output:
-            # Try to extract SID from path (common naming convention)
-            path_parts = oracle_home.split('/')
-            for part in path_parts:
-                if part.startswith('db_') or part.startswith('ora'):
-                    sid_output = part
-                    break
-        
-        patch_results.append({
-            "oracle_home": oracle_home,
-            "sid": sid_output,
-            "oracle_version": oracle_version_output,
+
+        # If there's no SID from processes, try to derive it from the path
+        sid_output = sections.get("SID", "").strip() or sid_from_path(oracle_home)
+
+        # Prefer patch data scanned from the inventory XML; the opatch
+        # fallback output is only present when the scan found nothing
+        inventory_output = sections.get("INVENTORY", "")
+        lspatches_output = parse_inventory_xml(inventory_output)
+        if not lspatches_output:
+            lspatches_output = sections.get("LSPATCHES", "")
+
+        # Intern the strings repeated on every row of the report so each
+        # value is stored once and shared across result dicts
+        result = {
+            "oracle_home": sys.intern(oracle_home),
+            "sid": sys.intern(sid_output),
+            "oracle_version": sections.get("SQLPLUS", ""),
             "lspatches": lspatches_output,
-            "version": version_output
-        })
-    
-    return patch_results
+            "version": sections.get("VERSION", "")
+        }
+        cached_results[oracle_home] = result
+
+        # Inventory files can exist but match no known schema (oneoff
+        # layouts vary across OPatch versions); opatch was suppressed
+        # shell-side in that case, so it must be run in a second pass
+        if inventory_output.strip() and not lspatches_output.strip():
+            fallback_homes.append(oracle_home)
+
+    if fallback_homes:
+        fallback_outputs = run_many(
+            ssh, [f"{home}/OPatch/opatch lspatches 2>/dev/null"
+                  for home in fallback_homes])
+        for oracle_home, output in zip(fallback_homes, fallback_outputs):
+            cached_results[oracle_home]["lspatches"] = output
+
+    # Cache the collected homes (after any fallback so incomplete output
+    # is never stored); only homes with a known inventory mtime qualify,
+    # and only the inventory-derived fields are persisted
+    cache_dirty = False
+    for oracle_home in missed_homes:
+        mtime = mtimes.get(oracle_home)
+        if mtime and oracle_home in cached_results:
+            result = cached_results[oracle_home]
+            with _cache_lock:
+                cache[f"{hostname}:{oracle_home}:{mtime}"] = {
+                    "oracle_version": result["oracle_version"],
+                    "lspatches": result["lspatches"],
+                    "version": result["version"]
+                }
+            cache_dirty = True
+
+    if cache_dirty:
+        _save_patch_cache()
+
+    # Preserve discovery order regardless of cache hits
+    return [cached_results[home] for home in oracle_homes if home in cached_results]
 
 def parse_patch_info(patch_info):
     """
-    Parses OPatch output to extract patch information
+    Parses OPatch output to extract patch information. Returns None when
+    there is no lspatches output to parse (e.g. OPatch failed), so the
+    home produces no row in the report
     """
+    if not patch_info["lspatches"].strip():
+        return None
+
     results = {
         "oracle_home": patch_info["oracle_home"],
         "sid": patch_info["sid"],
@@ -250,39 +667,27 @@ def parse_patch_info(patch_info):
     }
     
     # Extract Oracle version information if available
-    oracle_version_match = re.search(r'Version (\d+\.\d+\.\d+\.\d+)', patch_info["oracle_version"])
+    oracle_version_match = _RE_ORA_VERSION.search(patch_info["oracle_version"])
     if oracle_version_match:
         results["oracle_version"] = oracle_version_match.group(1)
-    
-    # Parse lspatches output
-    for line in patch_info["lspatches"].split('\n'):
-        match = re.search(r'(\d+);(.*)', line)
-        if match:
-            description = match.group(2).strip()
-            
-            # Determine patch type and release information
-            description_lower = description.lower()
-            
-            # Check if it's a database patch
-            if "database" in description_lower or "db" in description_lower:
-                db_release = extract_release_info(description)
-                if db_release and (not results["database_release"] or version_is_newer(db_release, results["database_release"])):
-                    results["database_release"] = db_release
-            
-            # Check if it's an OJVM patch
-            elif "ojvm" in description_lower or "java" in description_lower:
-                ojvm_release = extract_release_info(description)
-                if ojvm_release and (not results["ojvm_release"] or version_is_newer(ojvm_release, results["ojvm_release"])):
-                    results["ojvm_release"] = ojvm_release
-            
-            # Check if it's an OCW patch
-            elif "ocw" in description_lower or "client" in description_lower:
-                ocw_release = extract_release_info(description)
-                if ocw_release and (not results["ocw_release"] or version_is_newer(ocw_release, results["ocw_release"])):
-                    results["ocw_release"] = ocw_release
-    
+
+    # Parse lspatches output, walking the buffer directly instead of
+    # splitting it into an intermediate list of lines
+    for match in _RE_LSPATCHES.finditer(patch_info["lspatches"]):
+        description = match.group(2).strip()
+
+        # Classify the patch (database / OJVM / OCW) in one regex scan
+        kind_match = _RE_KIND.search(description)
+        if not kind_match:
+            continue
+
+        key = _KIND_KEYS[kind_match.group(1).lower()]
+        release = extract_release_info(description)
+        if release and (not results[key] or version_is_newer(release, results[key])):
+            results[key] = release
+
     # Parse version output
-    version_match = re.search(r'Version: ([\d\.]+)', patch_info["version"])
+    version_match = _RE_OPATCH_VERSION.search(patch_info["version"])
     if version_match:
         results["opatch_version"] = version_match.group(1)
     
@@ -292,99 +697,179 @@ def export_to_excel(server_data, filename):
     """
     Exports the collected data to an Excel file
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Oracle Patch Info"
-    
-    # Write headers
-    headers = ["Hostname", "SID", "Oracle Home", "Oracle Version", "OPatch Version", 
+    headers = ["Hostname", "SID", "Oracle Home", "Oracle Version", "OPatch Version",
                "Database Release", "OJVM RELEASE", "OCW RELEASE"]
-    for col, header in enumerate(headers, 1):
-        ws.cell(row=1, column=col, value=header)
-    
-    # Write data
-    row = 2
-    for server, homes_data in server_data.items():
-        for data in homes_data:
-            ws.cell(row=row, column=1, value=server)
-            ws.cell(row=row, column=2, value=data["sid"])
-            ws.cell(row=row, column=3, value=data["oracle_home"])
-            ws.cell(row=row, column=4, value=data["oracle_version"])
-            ws.cell(row=row, column=5, value=data["opatch_version"])
-            ws.cell(row=row, column=6, value=data["database_release"])
-            ws.cell(row=row, column=7, value=data["ojvm_release"])
-            ws.cell(row=row, column=8, value=data["ocw_release"])
-            row += 1
-    
-    # Save the workbook
-    wb.save(filename)
+
+    # Build all rows up front, then push them through the bulk append path
+    rows = [(server, data["sid"], data["oracle_home"],
+             data["oracle_version"], data["opatch_version"],
+             data["database_release"], data["ojvm_release"],
+             data["ocw_release"])
+            for server, homes_data in server_data.items()
+            for data in homes_data]
+
+    if xlsxwriter is not None:
+        # constant_memory flushes each row to disk as it is written
+        wb = xlsxwriter.Workbook(filename, {'constant_memory': True,
+                                            'strings_to_numbers': False})
+        ws = wb.add_worksheet("Oracle Patch Info")
+        ws.write_row(0, 0, headers)
+        for row_num, row in enumerate(rows, 1):
+            ws.write_row(row_num, 0, row)
+        wb.close()
+    else:
+        # Write-only mode streams rows straight to XML instead of holding the
+        # whole sheet of Cell objects in memory (openpyxl uses lxml when installed)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Oracle Patch Info")
+        ws.append(headers)
+        for row in rows:
+            ws.append(row)
+        wb.save(filename)
+
     print(f"Data exported to {filename}")
 
+def process_server(server, username, password):
+    """
+    Connects to a single server, collects patch information and returns
+    (server, parsed_patch_list). Returns (server, None) if the connection failed.
+    """
+    print(f"\nConnecting to {server}...")
+    ssh = connect_to_server(server, username, password)
+
+    if ssh is None:
+        return server, None
+
+    try:
+        print(f"Getting patch information from {server}...")
+        patch_info_list = get_oracle_patches(ssh, server)
+
+        parsed_list = []
+        for patch_info in patch_info_list:
+            parsed_info = parse_patch_info(patch_info)
+            if parsed_info:
+                parsed_list.append(parsed_info)
+
+        if patch_info_list:
+            print(f"Found {len(patch_info_list)} Oracle homes on {server}")
+        else:
+            print(f"No Oracle installations found on {server}")
+
+        print(f"Completed gathering information from {server}")
+        return server, parsed_list
+    finally:
+        # Close connection
+        ssh.close()
+
+def validate_credentials(server, username, password):
+    """
+    Serially validates credentials against one server before the parallel run,
+    allowing interactive retry with different credentials. Returns the
+    (username, password) pair that worked, or the originals if validation failed.
+    """
+    ssh = connect_to_server(server, username, password)
+
+    # If connection fails, try with different credentials
+    while ssh is None:
+        print(f"Failed to connect to {server} with current credentials.")
+        retry_option = input("Would you like to try with different credentials? (y/n): ")
+        if retry_option.lower() != 'y':
+            print("Continuing with current credentials.")
+            break
+        username = input("Enter username: ")
+        password = getpass.getpass(f"Enter password for {username}: ")
+        ssh = connect_to_server(server, username, password)
+
+    if ssh:
+        ssh.close()
+
+    return username, password
+
+def parse_args():
+    """
+    Parses command-line arguments for non-interactive (batch) runs
+    """
+    parser = argparse.ArgumentParser(
+        description="Collect Oracle patch information over SSH and export it to Excel")
+    parser.add_argument("--user", default="oracle",
+                        help="SSH username (default: oracle)")
+    parser.add_argument("--password-env", metavar="VAR",
+                        help="name of an environment variable holding the SSH password")
+    parser.add_argument("--servers-file",
+                        help="file containing one hostname/IP per line")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    interactive = sys.stdin.isatty()
+
     # Get list of servers
-    servers_input = input("Enter IP addresses/hostnames (comma-separated or from a file path): ")
-    
-    if os.path.isfile(servers_input):
-        with open(servers_input, 'r') as f:
+    if args.servers_file:
+        if not os.path.isfile(args.servers_file):
+            print(f"Servers file not found: {args.servers_file}")
+            return
+        with open(args.servers_file, 'r') as f:
             servers = [line.strip() for line in f if line.strip()]
+    elif interactive:
+        servers_input = input("Enter IP addresses/hostnames (comma-separated or from a file path): ")
+        if os.path.isfile(servers_input):
+            with open(servers_input, 'r') as f:
+                servers = [line.strip() for line in f if line.strip()]
+        else:
+            servers = [s.strip() for s in servers_input.split(',')]
     else:
-        servers = [s.strip() for s in servers_input.split(',')]
-    
-    # Try with default Oracle username
-    username = "oracle"
-    print(f"Attempting to connect with default username: {username}")
-    password = getpass.getpass(f"Enter password for {username}: ")
-    
+        print("No TTY attached: provide --servers-file for non-interactive runs.")
+        return
+
+    # Resolve the password once up front so worker threads never prompt
+    username = args.user
+    if args.password_env:
+        password = os.environ.get(args.password_env)
+        if password is None:
+            print(f"Environment variable {args.password_env} is not set.")
+            return
+    elif interactive:
+        print(f"Attempting to connect with username: {username}")
+        password = getpass.getpass(f"Enter password for {username}: ")
+    else:
+        print("No TTY attached: provide --password-env for non-interactive runs.")
+        return
+
+    # Intern hostnames: each one is repeated as a dict key and on every
+    # Excel row for that server
+    servers = [sys.intern(server) for server in servers]
+
     # Prepare output filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"oracle_patches_{timestamp}.xlsx"
-    
-    # Process each server
+
+    # Validate credentials against the first server before fanning out, so
+    # interactive prompts don't collide with worker threads. In batch mode
+    # the retry-with-different-credentials path is disabled and failed hosts
+    # are simply logged for a post-run retry.
+    if servers and interactive and not args.password_env:
+        print(f"\nValidating credentials against {servers[0]}...")
+        username, password = validate_credentials(servers[0], username, password)
+
+    # Process servers in parallel; each worker is I/O-bound on SSH round-trips
     server_data = {}
-    
-    for server in servers:
-        print(f"\nConnecting to {server}...")
-        ssh = connect_to_server(server, username, password)
-        
-        # If connection fails, try with different credentials
-        if ssh is None:
-            print(f"Failed to connect to {server} with default credentials.")
-            retry = True
-            while retry:
-                retry_option = input("Would you like to try with different credentials? (y/n): ")
-                if retry_option.lower() == 'y':
-                    username = input("Enter username: ")
-                    password = getpass.getpass(f"Enter password for {username}: ")
-                    ssh = connect_to_server(server, username, password)
-                    if ssh is None:
-                        print(f"Failed to connect to {server}. Authentication failed.")
-                    else:
-                        retry = False  # Successfully connected
-                else:
-                    print(f"Skipping {server}.")
-                    retry = False  # User chose not to retry
-        
-        if ssh:
-            print(f"Getting patch information from {server}...")
-            patch_info_list = get_oracle_patches(ssh)
-            
-            if patch_info_list:
-                server_data[server] = []
-                for patch_info in patch_info_list:
-                    parsed_info = parse_patch_info(patch_info)
-                    server_data[server].append(parsed_info)
-                print(f"Found {len(patch_info_list)} Oracle homes on {server}")
-            else:
-                print(f"No Oracle installations found on {server}")
-                server_data[server] = []
-            
-            # Close connection
-            ssh.close()
-            print(f"Completed gathering information from {server}")
-        
-        # Small delay to prevent overwhelming connections
-        time.sleep(1)
-    
+
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(servers)))) as executor:
+        futures = {executor.submit(process_server, server, username, password): server
+                   for server in servers}
+        for future in as_completed(futures):
+            try:
+                server, parsed_list = future.result()
+            except Exception as e:
+                print(f"Error processing {futures[future]}: {str(e)}")
+                continue
+
+            if parsed_list is None:
+                print(f"Skipping {server}: connection failed.")
+                continue
+
+            server_data[server] = parsed_list
+
     # Export data to Excel if we collected any data
     if server_data:
         export_to_excel(server_data, output_file)